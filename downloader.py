@@ -1,17 +1,97 @@
 import requests
+from requests.adapters import HTTPAdapter
+from concurrent.futures import ThreadPoolExecutor
+from os import path
+import hashlib
+import wiki_tools
 
-def download_file(download_url: str, save_path: str) -> None:
-    '''Download a file from url and save it to given path.'''
-    print(f'Downloading file from {download_url}...')
-    downloaded_data = requests.get(download_url).content
+DOWNLOAD_SEGMENTS = 8
+MIN_SEGMENT_SIZE = 1024 * 1024  # Smaller files are downloaded as one stream
+CHUNK_SIZE = 64 * 1024
+
+session = requests.Session()
+pool_size = 0
+
+
+def ensure_pool_size(size: int) -> None:
+    '''Makes connection pool of the session big enough for given amount of parallel requests.'''
+    global pool_size
+    if size > pool_size:
+        pool_size = size
+        session.mount('https://', HTTPAdapter(pool_connections=4, pool_maxsize=pool_size))
+        session.mount('http://', HTTPAdapter(pool_connections=4, pool_maxsize=pool_size))
+
+ensure_pool_size(DOWNLOAD_SEGMENTS)
+
+
+def download_file(download_url: str, save_path: str, segments: int = DOWNLOAD_SEGMENTS, sha256: str = '') -> None:
+    '''Download a file from url and save it to given path. If server supports
+    byte ranges, file is downloaded in parallel segments. If sha256 is given,
+    downloaded file is checked against it.'''
+    wiki_tools.log(f'Downloading file from {download_url}...')
+    head = session.head(download_url, allow_redirects=True)
+    file_size = 0
+    if head.ok and 'Content-Encoding' not in head.headers:
+        file_size = int(head.headers.get('Content-Length', 0))
+    supports_ranges = head.ok and head.headers.get('Accept-Ranges', 'none').lower() == 'bytes'
+    if supports_ranges and segments > 1 and file_size >= MIN_SEGMENT_SIZE:
+        download_segmented(head.url, save_path, file_size, segments)
+    else:
+        download_stream(head.url if head.ok else download_url, save_path)
+    if file_size and path.getsize(save_path) != file_size:
+        raise IOError(f'{save_path} has size {path.getsize(save_path)}, expected {file_size}!')
+    if sha256 and file_sha256(save_path) != sha256.lower():
+        raise IOError(f'{save_path} does not match expected sha256 hash!')
+
+def download_stream(download_url: str, save_path: str) -> None:
+    '''Download a file as one stream.'''
+    with session.get(download_url, stream=True) as response:
+        response.raise_for_status()
+        with open(save_path, 'wb') as file:
+            for chunk in response.iter_content(CHUNK_SIZE):
+                file.write(chunk)
+
+def download_segmented(download_url: str, save_path: str, file_size: int, segments: int) -> None:
+    '''Download a file in parallel byte range segments into preallocated file.'''
     with open(save_path, 'wb') as file:
-        file.write(downloaded_data)
+        file.truncate(file_size)
+    segment_size = -(-file_size // segments)
+    ranges = [
+        (start, min(start + segment_size, file_size) - 1)
+        for start in range(0, file_size, segment_size)
+    ]
+    ensure_pool_size(len(ranges))
+    with ThreadPoolExecutor(len(ranges)) as executor:
+        for future in [executor.submit(download_range, download_url, save_path, *byte_range) for byte_range in ranges]:
+            future.result()
+
+def download_range(download_url: str, save_path: str, start: int, end: int) -> None:
+    '''Download bytes from start to end (inclusive) and write them in place.'''
+    headers = {'Range': f'bytes={start}-{end}'}
+    with session.get(download_url, headers=headers, stream=True) as response:
+        response.raise_for_status()
+        if response.status_code != 206:
+            raise IOError(f'Server ignored byte range {start}-{end} for {download_url}!')
+        with open(save_path, 'r+b') as file:
+            file.seek(start)
+            for chunk in response.iter_content(CHUNK_SIZE):
+                file.write(chunk)
+            if file.tell() != end + 1:
+                raise IOError(f'Byte range {start}-{end} of {download_url} is incomplete!')
+
+def file_sha256(file_path: str) -> str:
+    '''Returns sha256 hex digest of a file.'''
+    file_hash = hashlib.sha256()
+    with open(file_path, 'rb') as file:
+        for chunk in iter(lambda: file.read(CHUNK_SIZE), b''):
+            file_hash.update(chunk)
+    return file_hash.hexdigest()
 
 def find_release(repo_link: str, tag: str) -> tuple:
-    response = requests.get(repo_link)
+    response = session.get(repo_link)
     releases = response.json()
     for release in releases:
         if release['target_commitish'] == tag:
             link = release['zipball_url']
             version = release['tag_name'][1:]
-            return (link, version)
\ No newline at end of file
+            return (link, version)
@@ -0,0 +1,119 @@
+'''
+Small JSON backend abstraction for plain JSON files. Uses orjson for loading
+and dumping when it is installed and falls back to standard json module
+otherwise. Output of dumps is identical for both backends.
+
+Run this file to compare backends:
+    python json_backend.py <resource pack path> <behavior pack path>
+'''
+import json
+import math
+import re
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+BACKEND = 'orjson' if orjson else 'json'
+
+# Floats which orjson writes differently from float.__repr__: exponents
+# (1e16 instead of 1e+16) and small decimals (0.00001 instead of 1e-05)
+EXPONENT = re.compile(r'e-?[0-9]')
+SMALL_DECIMAL = '0.0000'
+STRING_OR_FLOAT = re.compile(r'"(?:[^"\\]|\\.)*"|-?[0-9]+(?:\.[0-9]+)?(?:[eE][-+]?[0-9]+)?')
+
+
+def set_backend(backend: str) -> None:
+    """Sets used backend ("orjson" or "json")."""
+    global BACKEND
+    if backend == 'orjson' and orjson is None:
+        raise ImportError('orjson is not installed!')
+    BACKEND = backend
+
+def loads(s):
+    """Deserializes JSON string or bytes."""
+    if BACKEND == 'orjson':
+        try:
+            return orjson.loads(s)
+        except orjson.JSONDecodeError:
+            pass  # Let json module parse it or raise more detailed error
+    return json.loads(s)
+
+def load(fp):
+    """Deserializes JSON from file object."""
+    return loads(fp.read())
+
+def dumps(obj, indent: int = None) -> str:
+    """Serializes obj exactly like json.dumps(obj, indent=indent) does."""
+    if BACKEND != 'orjson' or not indent:
+        return json.dumps(obj, indent=indent)
+    try:
+        data = orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode('utf-8')
+    except TypeError:
+        return json.dumps(obj, indent=indent)
+    if 'null' in data and _has_non_finite_float(obj):
+        # orjson writes NaN and Infinity as null
+        return json.dumps(obj, indent=indent)
+    if indent != 2:
+        # JSON output can't contain raw new lines or tabs outside of escapes,
+        # so indentation levels are marked with tabs (deepest first) and then
+        # replaced with required indent
+        depth = 1
+        while '\n' + '  '*depth in data:
+            depth += 1
+        for level in range(depth-1, 0, -1):
+            data = data.replace('\n' + '  '*level, '\n' + '\t'*level)
+        data = data.replace('\t', ' '*indent)
+    if SMALL_DECIMAL in data or _has_exponent(data):
+        data = STRING_OR_FLOAT.sub(_fix_float, data)
+    if not data.isascii() or '\x7f' in data:
+        data = STRING_OR_FLOAT.sub(_fix_string, data)
+    return data
+
+def _has_non_finite_float(obj) -> bool:
+    if isinstance(obj, float):
+        return not math.isfinite(obj)
+    if isinstance(obj, dict):
+        return any(_has_non_finite_float(value) for value in obj.values())
+    if isinstance(obj, list):
+        return any(_has_non_finite_float(value) for value in obj)
+    return False
+
+def _has_exponent(data: str) -> bool:
+    for match in EXPONENT.finditer(data):
+        if data[match.start()-1].isdigit():
+            return True
+    return False
+
+def _fix_float(match) -> str:
+    token = match.group()
+    if token[0] == '"' or ('.' not in token and 'e' not in token and 'E' not in token):
+        return token
+    return repr(float(token))
+
+def _fix_string(match) -> str:
+    token = match.group()
+    if token[0] != '"' or (token.isascii() and '\x7f' not in token):
+        return token
+    return json.dumps(json.loads(token))
+
+
+if __name__ == '__main__':
+    from os import path
+    from timeit import timeit
+    import sys
+    import wiki_tools
+    import wiki_content_generator as wcg
+
+    rp_path, bp_path = sys.argv[1], sys.argv[2]
+    wiki_tools.DRY_RUN = True
+    with open(path.join(rp_path, 'sounds', 'sound_definitions.json'), 'rb') as sound_definitions:
+        sound_definitions_data = sound_definitions.read()
+    for backend in ['json', 'orjson']:
+        set_backend(backend)
+        wiki_tools.PARSED_FILES.clear()  # Every backend is timed with a cold parse cache
+        parsed = loads(sound_definitions_data)
+        print(f'{backend}: sound_definitions.json loads - {timeit(lambda: loads(sound_definitions_data), number=20)/20*1000:.2f} ms')
+        print(f'{backend}: sound_definitions.json dumps - {timeit(lambda: dumps(parsed, indent=4), number=20)/20*1000:.2f} ms')
+        print(f'{backend}: entities rendering - {timeit(lambda: wcg.generate_vu_entities(bp_path, "", "vuc-full.md", -1, -1), number=1):.2f} s')
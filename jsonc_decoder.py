@@ -14,6 +14,9 @@ INLINE_COMMENT = re.compile(r'//[^\n]*\n?', FLAGS)
 INLINE_COMMENT_STRING_START='//'
 MULTILINE_COMMENT = re.compile(r"/[*]([^*]|([*][^/]))*[*]+/", FLAGS)
 MULTILINE_COMMENT_STRING_START='/*'
+# Tokens which matter when skipping a value: strings and comments (which may
+# contain brackets) and brackets
+SKIP_TOKEN = re.compile(r'"[^"\\]*(?:\\.[^"\\]*)*"|//[^\n]*|/[*].*?[*]/|[\[\]{}]', re.DOTALL)
 
 
 def parse_object(
@@ -212,15 +215,121 @@ def parse_array(
     return values, end
 
 
+def skip_ignored(
+    s, end, _w=WHITESPACE.match, _ws=WHITESPACE_STR,
+    _ilcs=INLINE_COMMENT_STRING_START, _ilc=INLINE_COMMENT.match,
+    _mlcs=MULTILINE_COMMENT_STRING_START, _mlc=MULTILINE_COMMENT.match
+):
+    '''
+    Returns index of the first character after whitespaces and comments.
+    '''
+    while True:
+        nextchar = s[end:end + 1]
+        if nextchar and nextchar in _ws:
+            end = _w(s, end).end()
+        elif s.startswith(_ilcs, end):
+            end = _ilc(s, end).end()
+        elif s.startswith(_mlcs, end):
+            end = _mlc(s, end).end()
+        else:
+            return end
+
+
+def skip_value(s, end, scan_once, _skip_token=SKIP_TOKEN.finditer):
+    '''
+    Returns index of the first character after the value without building it.
+    Objects and arrays are skipped by matching brackets outside of strings and
+    comments.
+    '''
+    if s[end:end + 1] not in ('{', '['):
+        try:
+            return scan_once(s, end)[1]
+        except StopIteration as err:
+            raise JSONDecodeError("Expecting value", s, err.value) from None
+    depth = 0
+    for token in _skip_token(s, end):
+        bracket = token.group()
+        if bracket in ('{', '['):
+            depth += 1
+        elif bracket in ('}', ']'):
+            depth -= 1
+            if depth == 0:
+                return token.end()
+    raise JSONDecodeError("Unterminated value", s, end)
+
+
+def parse_projected(s, end, projection, strict, scan_once, memo):
+    '''
+    Parses value at end, but builds only object keys from projection (see
+    make_projection). Other values are skipped with skip_value.
+    '''
+    if s[end:end + 1] != '{':
+        try:
+            return scan_once(s, end)
+        except StopIteration as err:
+            raise JSONDecodeError("Expecting value", s, err.value) from None
+    pairs = {}
+    end = skip_ignored(s, end + 1)
+    if s[end:end + 1] == '}':
+        return pairs, end + 1
+    while True:
+        if s[end:end + 1] != '"':
+            raise JSONDecodeError(
+                "Expecting property name enclosed in double quotes", s, end)
+        key, end = scanstring(s, end + 1, strict)
+        end = skip_ignored(s, end)
+        if s[end:end + 1] != ':':
+            raise JSONDecodeError("Expecting ':' delimiter", s, end)
+        end = skip_ignored(s, end + 1)
+        if key not in projection:
+            end = skip_value(s, end, scan_once)
+        elif projection[key] is None:
+            try:
+                pairs[memo.setdefault(key, key)], end = scan_once(s, end)
+            except StopIteration as err:
+                raise JSONDecodeError("Expecting value", s, err.value) from None
+        else:
+            pairs[memo.setdefault(key, key)], end = parse_projected(
+                s, end, projection[key], strict, scan_once, memo)
+        end = skip_ignored(s, end)
+        nextchar = s[end:end + 1]
+        if nextchar == '}':
+            return pairs, end + 1
+        elif nextchar != ',':
+            raise JSONDecodeError("Expecting ',' delimiter", s, end)
+        end = skip_ignored(s, end + 1)
+
+
+def make_projection(key_paths):
+    '''
+    Makes projection tree from key paths (tuples of object keys), e.g.
+    [('minecraft:entity', 'components')] -> {'minecraft:entity':
+    {'components': None}}. None means that value is built entirely.
+    '''
+    projection = {}
+    for key_path in key_paths:
+        node = projection
+        for key in key_path[:-1]:
+            if key in node and node[key] is None:
+                break
+            node = node.setdefault(key, {})
+        else:
+            node[key_path[-1]] = None
+    return projection
+
+
 class JSONCDecoder(json.JSONDecoder):
     '''
     JSONDecoder with support for C-style comments. Similar to JSONC files from
     Visual Studio code but without support for trailing commas.
+    Projection is an optional list of key paths (tuples of object keys). If it
+    is set, only these paths are built and the rest of the document is skipped.
     '''
-    def __init__(self, *args, **kwargs):
+    def __init__(self, *args, projection=None, **kwargs):
         json.JSONDecoder.__init__(self, *args, **kwargs)
         self.parse_object = parse_object
         self.parse_array = parse_array
+        self.projection = None if projection is None else make_projection(projection)
 
         # we need to recreate the internal scan function ..
         self.scan_once = scanner.py_make_scanner(self)
@@ -244,7 +353,11 @@ class JSONCDecoder(json.JSONDecoder):
                     break
         except IndexError:
             pass
-        obj, end = self.raw_decode(s, idx)
+        if self.projection is None:
+            obj, end = self.raw_decode(s, idx)
+        else:
+            obj, end = parse_projected(
+                s, idx, self.projection, self.strict, self.scan_once, self.memo)
         end = _w(s, end).end()
         if end != len(s):
             raise JSONDecodeError("Extra data", s, end)
@@ -0,0 +1,71 @@
+'''
+Adds LangIndex class - parsed index of .lang files from texts folder of
+resource pack. Every language file is parsed only once, when it is needed for
+the first time, into key-value map.
+'''
+from os import path
+import mmap
+import wiki_tools
+
+MMAP_THRESHOLD = 1024 * 1024  # Files larger than this (in bytes) are mmapped
+COMMENT_START = '##'
+INLINE_COMMENT_START = '\t#'
+
+
+def parse_lang(lines) -> dict:
+    """Parses lines of .lang file into key-value map. Skips comments and empty lines."""
+    entries = {}
+    for line in lines:
+        line = line.strip()
+        if not line or line.startswith(COMMENT_START) or '=' not in line:
+            continue
+        key, value = line.split('=', 1)
+        if INLINE_COMMENT_START in value:
+            value = value[:value.index(INLINE_COMMENT_START)]
+        entries[key] = value.rstrip()
+    return entries
+
+
+class LangIndex:
+    '''
+    Lazy index of .lang files from given texts folder. Languages are loaded
+    on first access and cached. Large files on disk are read through mmap.
+    '''
+    def __init__(self, texts_path: str):
+        self.texts_path = texts_path
+        self._languages = {}
+
+    def languages(self) -> list:
+        """Returns sorted list of available languages (file names without .lang)."""
+        return sorted(
+            filename[:-len('.lang')] for filename in wiki_tools.list_dir(self.texts_path)
+            if filename.endswith('.lang')
+        )
+
+    def get(self, language: str = 'en_US') -> dict:
+        """Returns key-value map of given language."""
+        if language not in self._languages:
+            self._languages[language] = self._parse(language)
+        return self._languages[language]
+
+    def with_prefix(self, prefix: str, language: str = 'en_US') -> dict:
+        """Returns all entries of given language which keys start with prefix."""
+        return {
+            key: value for key, value in self.get(language).items()
+            if key.startswith(prefix)
+        }
+
+    def invalidate(self, language: str) -> None:
+        """Forgets parsed language, so it is parsed again on next access."""
+        self._languages.pop(language, None)
+
+    def _parse(self, language: str) -> dict:
+        lang_path = path.join(self.texts_path, language + '.lang')
+        if path.normpath(lang_path) in wiki_tools.MEMORY_FILES:
+            return parse_lang(wiki_tools.read_file(lang_path).decode('utf-8-sig').splitlines())
+        with open(lang_path, 'rb') as lang_file:
+            if path.getsize(lang_path) < MMAP_THRESHOLD:
+                return parse_lang(lang_file.read().decode('utf-8-sig').splitlines())
+            # Lines are parsed straight from the map, so the file is never copied whole
+            with mmap.mmap(lang_file.fileno(), 0, access=mmap.ACCESS_READ) as lang_map:
+                return parse_lang(line.decode('utf-8-sig') for line in iter(lang_map.readline, b''))
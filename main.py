@@ -4,35 +4,69 @@ configuration (no arguments) downloads the stable version of packs.
 
 --skip_download
 --download_mode ["stable" or "preview"]
+--dry_run
+--example_budget [bytes per component on limited vanilla usage pages]
+--watch
 
 
 Examples:
     Downloading preview packs and extracting data from them:
         python main.py --download_mode preview
 
+    Showing which wiki pages would change without writing them:
+        python main.py --dry_run
+
+    Selecting structurally distinct examples within 4 KB per component on
+    limited vanilla usage pages:
+        python main.py --example_budget 4096
+
+    Keeping packs in memory and regenerating pages affected by changes in
+    packs, custom data or generator modules:
+        python main.py --skip_download --watch
+
     Downloading packs from custom urls
         python main--repo_url example.com
 
 The scripts uses temporary path `packs`. The path is not cleared after the
 execution, it conditionally removed and added again at the start of the script.
+Vanilla packs are read from the zip into memory, only watch mode extracts them
+into `packs`.
 """
 
 # Absolutely unreadable code xD
 
+import jsonc_decoder
+import json_backend
 import wiki_tools
+import lang_index
+import resource_pack_index
 import wiki_content_generator as wcg
+import watcher
+import pack_loader
 from tkinter import filedialog
-from os import path, makedirs, listdir, chdir
+from os import path, makedirs, listdir, chdir, sep
 from downloader import download_file, find_release
 from zipfile import ZipFile
+from importlib import reload
+from time import sleep, perf_counter
+import asyncio
 import sys
 import shutil
 
 
+FULL_PAGE_SIZE_LIMIT = 1024 * 1024  # Full vanilla usage pages bigger than this (in bytes) are split into shards
+RP_PATH = path.join('packs', 'resource_pack')
+BP_PATH = path.join('packs', 'behavior_pack')
+CUSTOM_DATA_PATH = 'custom_data'
+# Modules reloaded in watch mode (in this order) when one of them changes
+GENERATOR_MODULES = [jsonc_decoder, json_backend, wiki_tools, lang_index, resource_pack_index, wcg]
+WATCH_INTERVAL = 0.25  # Seconds between checks for changes in watch mode
+
+
 def launch() -> None:
     print('Welcome to Bedrock Wiki Content Generator!')
     argv = sys.argv
-    global DOWNLOAD_MODE, SKIP_DOWNLOAD, DOWNLOAD_LINK, VERSION_TAG
+    global DOWNLOAD_MODE, SKIP_DOWNLOAD, VERSION_TAG, EXAMPLE_BUDGET, WATCH
 
     if '--download_mode' in argv and len(argv) > argv.index('--download_mode'):
         DOWNLOAD_MODE = argv[argv.index('--download_mode')+1]
@@ -40,12 +74,17 @@ def launch() -> None:
         DOWNLOAD_MODE = 'stable'
     if DOWNLOAD_MODE in ['stable', 'preview']:
         VERSION_TAG = {'stable': 'main', 'preview': 'preview'}[DOWNLOAD_MODE]
-        DOWNLOAD_LINK = find_release('https://api.github.com/repos/Mojang/bedrock-samples/releases?per_page=10&page=1', VERSION_TAG)[0]
     else:
         print(f'Unknown download mode {DOWNLOAD_MODE}.')
         exit()
 
     SKIP_DOWNLOAD = '--skip_download' in argv
+    WATCH = '--watch' in argv
+    wiki_tools.DRY_RUN = '--dry_run' in argv
+    if '--example_budget' in argv and len(argv) > argv.index('--example_budget')+1:
+        EXAMPLE_BUDGET = int(argv[argv.index('--example_budget')+1])
+    else:
+        EXAMPLE_BUDGET = -1
     main()
 
 def clear_folders(parent_folder_name) -> None:
@@ -55,55 +94,92 @@ def clear_folders(parent_folder_name) -> None:
         if not element.endswith('.zip'):
             shutil.rmtree(path.join(parent_folder_name, element), True)
 
-def main() -> None:
-    # Set some variables
-    chdir(path.dirname(path.realpath(__file__)))
-    rp_path = path.join('packs', 'resource_pack')
-    bp_path = path.join('packs', 'behavior_pack')
-    repo_save_path = path.join('packs', 'vp.zip')
-    wiki_path_file = 'wiki_local_path.txt'
-    is_stable = DOWNLOAD_MODE == 'stable'
-    custom_data_path = 'custom_data'
-    # test_page_path = 'test-page.md'
-    
-    # Download & extract packs
-    if not SKIP_DOWNLOAD:
-        shutil.rmtree('packs', True)
-        makedirs('packs', exist_ok=True)
-
-        print('Downloading files...')
-        download_file(DOWNLOAD_LINK, repo_save_path)
-        print('Downloaded!')
-
-    print('Removing old files if they exist...')
-    clear_folders('packs')
-    clear_folders('custom_data')
-    print('Removed!')
+def extract_custom_data(zip_filename: str) -> None:
+    """Extracts custom data zip into folder with the same name."""
+    extracted_path = path.join(CUSTOM_DATA_PATH, zip_filename.replace('.zip', ''))
+    shutil.rmtree(extracted_path, True)
+    with ZipFile(path.join(CUSTOM_DATA_PATH, zip_filename)) as unzipping_file:
+        unzipping_file.extractall(extracted_path)
 
-    print('Extracting vanilla files...')
-    with ZipFile(repo_save_path) as unzipping_file:
-        unzipping_file.extractall('packs')
-    print('Extracted!')
-
-    packs_contents = listdir('packs')
-    if 'vp.zip' in packs_contents:
-        packs_contents.remove('vp.zip')
-    extracted_folder = packs_contents[0]
+def get_custom_data_pages(wiki_path: str) -> list:
+    """Returns list of (input paths, page generator) for every page generated from custom data."""
+    custom_data_version = wcg.get_custom_data_version()
+    docs_path = path.join(wiki_path, 'docs')
+    return [
+        ((path.join(CUSTOM_DATA_PATH, 'biomes'),), lambda: wcg.generate_biome_tags_tables(path.join(CUSTOM_DATA_PATH, 'biomes'), custom_data_version, path.join(docs_path, 'world-generation', 'biome-tags.md'))), # biome and tags tables
+    ]
 
-    print('Copying packs...')
-    shutil.move(path.join('packs', extracted_folder, 'behavior_pack'), 'packs')
-    shutil.move(path.join('packs', extracted_folder, 'resource_pack'), 'packs')
-    print('Copied!')
+def get_pack_pages(rp_index: resource_pack_index.ResourcePackIndex, wiki_path: str) -> list:
+    """Returns list of (input paths, page generator) for every page generated from vanilla packs."""
+    is_stable = DOWNLOAD_MODE == 'stable'
+    version = wcg.get_version(rp_index, is_stable)
+    manifest_path = path.join(RP_PATH, 'manifest.json')  # Version of every vanilla page depends on it
+    docs_path = path.join(wiki_path, 'docs')
+    return [
+        ((manifest_path, path.join(RP_PATH, 'blocks.json')), lambda: wiki_tools.upload_content(path.join(docs_path, 'blocks', 'block-sounds.md'), wcg.get_block_sounds(rp_index, version))), # block sounds
+        ((manifest_path, path.join(RP_PATH, 'blocks.json')), lambda: wiki_tools.upload_content(path.join(docs_path, 'commands', 'nbt-commands.md'), wcg.can_place_on_everything(rp_index, version))), # can_place_on_everything
+        ((manifest_path, path.join(RP_PATH, 'texts')), lambda: wiki_tools.upload_content(path.join(docs_path, 'documentation', 'menu-categories.md'), wcg.get_creative_categories_table(rp_index.lang, version))), # creative categories
+        ((manifest_path, path.join(RP_PATH, 'biomes_client.json')), lambda: wiki_tools.upload_content(path.join(docs_path, 'documentation', 'fog-ids.md'), wcg.get_fogs_table(rp_index, version))), # fog ids
+        ((manifest_path, path.join(RP_PATH, 'sounds', 'sound_definitions.json')), lambda: wcg.generate_sound_definitions(rp_index, version, path.join(docs_path, 'documentation', 'sound-definitions.md'))), # sound definitions
+        ((manifest_path, path.join(BP_PATH, 'spawn_rules')), lambda: wcg.generate_vu_spawn_rules(BP_PATH, version, path.join(docs_path, 'entities', 'vanilla-usage-spawn-rules.md'), 8, example_budget=EXAMPLE_BUDGET)), # vanilla usage spawn rules
+        ((manifest_path, path.join(BP_PATH, 'spawn_rules')), lambda: wcg.generate_vu_spawn_rules(BP_PATH, version, path.join(docs_path, 'entities', 'vusr-full.md'), -1, FULL_PAGE_SIZE_LIMIT)), # full vanilla usage spawn rules
+        ((manifest_path, path.join(BP_PATH, 'items')), lambda: wcg.generate_vu_items(BP_PATH, version, path.join(docs_path, 'items', 'vanilla-usage-items.md'), 8, example_budget=EXAMPLE_BUDGET)), # vanilla usage items
+        ((manifest_path, path.join(BP_PATH, 'items')), lambda: wcg.generate_vu_items(BP_PATH, version, path.join(docs_path, 'items', 'vui-full.md'), -1, FULL_PAGE_SIZE_LIMIT)), # full vanilla usage items
+        ((manifest_path, path.join(BP_PATH, 'entities')), lambda: wcg.generate_vu_entities(BP_PATH, version, path.join(docs_path, 'entities', 'vanilla-usage-components.md'), 8, 3, example_budget=EXAMPLE_BUDGET)), # vanilla usage entities
+        ((manifest_path, path.join(BP_PATH, 'entities')), lambda: wcg.generate_vu_entities(BP_PATH, version, path.join(docs_path, 'entities', 'vuc-full.md'), -1, -1, FULL_PAGE_SIZE_LIMIT)), # full vanilla usage entities
+    ]
 
-    shutil.rmtree(path.join('packs', extracted_folder))
+def watch(rp_index: resource_pack_index.ResourcePackIndex, wiki_path: str) -> None:
+    """Regenerates pages affected by changes in packs, custom data or generator modules until interrupted. Parsed files are kept in memory and only changed ones are parsed again."""
+    module_paths = {path.basename(module.__file__): module for module in GENERATOR_MODULES}
+    watched_paths = [RP_PATH, BP_PATH, CUSTOM_DATA_PATH] + list(module_paths)
+    files = watcher.snapshot(*watched_paths)
+    print('Watching for changes... (Ctrl+C to stop)')
+    try:
+        while True:
+            sleep(WATCH_INTERVAL)
+            new_files = watcher.snapshot(*watched_paths)
+            changed_paths = watcher.changed_paths(files, new_files)
+            if not changed_paths:
+                continue
+            start_time = perf_counter()
+            changed_zips = [changed_path for changed_path in changed_paths if path.dirname(changed_path) == CUSTOM_DATA_PATH and changed_path.endswith('.zip')]
+            for changed_zip in changed_zips:
+                if path.exists(changed_zip):
+                    extract_custom_data(path.basename(changed_zip))
+            if changed_zips:
+                new_files = watcher.snapshot(*watched_paths)
+                changed_paths |= watcher.changed_paths(files, new_files)
+            files = new_files
 
-    print('Extracting custom data...')
-    for element in listdir(custom_data_path):
-        with ZipFile(path.join(custom_data_path, element)) as unzipping_file:
-            unzipping_file.extractall(path.join(custom_data_path, element.replace('.zip', '')))
-    print('Extracted!')
+            is_module_changed = any(changed_path in module_paths for changed_path in changed_paths)
+            if is_module_changed:
+                dry_run = wiki_tools.DRY_RUN
+                for module in GENERATOR_MODULES:
+                    reload(module)
+                wiki_tools.DRY_RUN = dry_run
+                rp_index = resource_pack_index.ResourcePackIndex(RP_PATH)
+            else:
+                for changed_path in changed_paths:
+                    if changed_path.startswith(RP_PATH + sep):
+                        rp_index.invalidate(path.relpath(changed_path, RP_PATH))
+            print('---')
+            try:
+                for page_inputs, generate_page in get_custom_data_pages(wiki_path) + get_pack_pages(rp_index, wiki_path):
+                    if is_module_changed or any(
+                        changed_path == page_input or changed_path.startswith(page_input + sep)
+                        for changed_path in changed_paths for page_input in page_inputs
+                    ):
+                        generate_page()
+            except Exception as error:
+                print(f'Error! {type(error).__name__}: {error}')
+            print(f'Regenerated in {perf_counter() - start_time:.2f} s.')
+    except KeyboardInterrupt:
+        print('Stopped watching.')
 
-    # Wiki repo folder local path
+def get_wiki_path() -> str:
+    """Returns local path of Wiki repository folder. Asks for it if it is not saved yet."""
+    wiki_path_file = 'wiki_local_path.txt'
     if path.exists(wiki_path_file):
         with open(wiki_path_file, 'r+') as wiki_path_file:
             wiki_path = wiki_path_file.readline()
@@ -116,29 +192,104 @@ def main() -> None:
         with open(wiki_path_file, 'w') as wiki_path_file:
             wiki_path = filedialog.askdirectory()
             wiki_path_file.write(wiki_path)
+    return wiki_path
+
+async def download_packs(repo_save_path: str) -> None:
+    """Finds release and downloads vanilla packs."""
+    download_link = (await asyncio.to_thread(find_release, 'https://api.github.com/repos/Mojang/bedrock-samples/releases?per_page=10&page=1', VERSION_TAG))[0]
+    shutil.rmtree('packs', True)
+    makedirs('packs', exist_ok=True)
+    wiki_tools.log('Downloading files...')
+    await asyncio.to_thread(download_file, download_link, repo_save_path)
+    wiki_tools.log('Downloaded!')
 
-    # Content generation
+def load_packs(repo_save_path: str) -> None:
+    """Loads vanilla packs from zip into memory or, in watch mode, extracts them into packs folder."""
+    if WATCH:
+        # Watch mode needs packs on disk, so they can be edited
+        wiki_tools.log('Extracting vanilla files...')
+        with ZipFile(repo_save_path) as unzipping_file:
+            unzipping_file.extractall('packs')
+        wiki_tools.log('Extracted!')
+
+        packs_contents = listdir('packs')
+        if 'vp.zip' in packs_contents:
+            packs_contents.remove('vp.zip')
+        extracted_folder = packs_contents[0]
+
+        wiki_tools.log('Copying packs...')
+        shutil.move(path.join('packs', extracted_folder, 'behavior_pack'), 'packs')
+        shutil.move(path.join('packs', extracted_folder, 'resource_pack'), 'packs')
+        wiki_tools.log('Copied!')
+
+        shutil.rmtree(path.join('packs', extracted_folder))
+    else:
+        wiki_tools.log('Loading vanilla files into memory...')
+        wiki_tools.mount_memory_files(pack_loader.load_pack_members(repo_save_path, 'packs'))
+        wiki_tools.log('Loaded!')
+
+def extract_all_custom_data() -> None:
+    """Extracts every custom data zip."""
+    wiki_tools.log('Extracting custom data...')
+    for element in listdir(CUSTOM_DATA_PATH):
+        extract_custom_data(element)
+    wiki_tools.log('Extracted!')
+
+async def generate_pages(pages: list) -> None:
+    """Runs page generators in threads."""
+    await asyncio.gather(*(asyncio.to_thread(generate_page) for _, generate_page in pages))
+
+async def generate_custom_data_pages(wiki_path: str) -> None:
+    """Extracts custom data and generates pages from it."""
+    await asyncio.to_thread(extract_all_custom_data)
+    await generate_pages(get_custom_data_pages(wiki_path))
+
+async def generate_pack_pages(wiki_path: str, repo_save_path: str) -> resource_pack_index.ResourcePackIndex:
+    """Downloads (if needed) and loads vanilla packs, then generates pages from them."""
+    if not SKIP_DOWNLOAD:
+        await download_packs(repo_save_path)
+    await asyncio.to_thread(load_packs, repo_save_path)
+    rp_index = resource_pack_index.ResourcePackIndex(RP_PATH)
+    await generate_pages(get_pack_pages(rp_index, wiki_path))
+    wiki_tools.log(wcg.get_version(rp_index, DOWNLOAD_MODE == 'stable'))
+    return rp_index
+
+async def generate_all_pages(wiki_path: str, repo_save_path: str) -> resource_pack_index.ResourcePackIndex:
+    """Generates all pages. Custom data pages don't wait for download of vanilla packs."""
+    _, rp_index = await asyncio.gather(
+        generate_custom_data_pages(wiki_path),
+        generate_pack_pages(wiki_path, repo_save_path)
+    )
+    return rp_index
+
+def main() -> None:
+    # Set some variables
+    chdir(path.dirname(path.realpath(__file__)))
+    rp_path = RP_PATH
+    bp_path = BP_PATH
+    repo_save_path = path.join('packs', 'vp.zip')
+    custom_data_path = CUSTOM_DATA_PATH
+    # test_page_path = 'test-page.md'
+
+    print('Removing old files if they exist...')
+    if SKIP_DOWNLOAD:
+        clear_folders('packs')
+    clear_folders('custom_data')
+    print('Removed!')
+
+    # Wiki repo folder local path
+    wiki_path = get_wiki_path()
+
+    # Download, extraction and content generation
     print('---')
-    version = wcg.get_version(rp_path, is_stable)
-    custom_data_version = wcg.get_custom_data_version()
-    wiki_tools.upload_content(path.join(wiki_path, 'docs', 'blocks', 'block-sounds.md'), wcg.get_block_sounds(rp_path, version)) # block sounds
-    wiki_tools.upload_content(path.join(wiki_path, 'docs', 'commands', 'nbt-commands.md'), wcg.can_place_on_everything(rp_path, version)) # can_place_on_everything
-    wiki_tools.upload_content(path.join(wiki_path, 'docs', 'documentation', 'menu-categories.md'), wcg.get_creative_categories_table(rp_path, version)) # creative categories
-    wiki_tools.upload_content(path.join(wiki_path, 'docs', 'documentation', 'fog-ids.md'), wcg.get_fogs_table(rp_path, version)) # fog ids
-    wcg.generate_sound_definitions(rp_path, version, path.join(wiki_path, 'docs', 'documentation', 'sound-definitions.md')) # sound definitions
-    wcg.generate_biome_tags_tables(path.join(custom_data_path, 'biomes'), custom_data_version, path.join(wiki_path, 'docs', 'world-generation', 'biome-tags.md')) # biome and tags tables
-    wcg.generate_vu_spawn_rules(bp_path, version, path.join(wiki_path, 'docs', 'entities', 'vanilla-usage-spawn-rules.md'), 8) # vanilla usage spawn rules
-    wcg.generate_vu_spawn_rules(bp_path, version, path.join(wiki_path, 'docs', 'entities', 'vusr-full.md'), -1) # full vanilla usage spawn rules
-    wcg.generate_vu_items(bp_path, version, path.join(wiki_path, 'docs', 'items', 'vanilla-usage-items.md'), 8) # vanilla usage items
-    wcg.generate_vu_items(bp_path, version, path.join(wiki_path, 'docs', 'items', 'vui-full.md'), -1) # full vanilla usage items
-    wcg.generate_vu_entities(bp_path, version, path.join(wiki_path, 'docs', 'entities', 'vanilla-usage-components.md'), 8, 3) # vanilla usage entities
-    wcg.generate_vu_entities(bp_path, version, path.join(wiki_path, 'docs', 'entities', 'vuc-full.md'), -1, -1) # full vanilla usage entities
-    print(version)
+    rp_index = asyncio.run(generate_all_pages(wiki_path, repo_save_path))
+    if WATCH:
+        watch(rp_index, wiki_path)
 
     # Remove files
     print('Removing unneeded contents...')
-    shutil.rmtree(rp_path)
-    shutil.rmtree(bp_path)
+    shutil.rmtree(rp_path, True)
+    shutil.rmtree(bp_path, True)
     custom_data_contents = listdir(custom_data_path)
     for element in custom_data_contents:
         if not element.endswith('.zip'):
@@ -149,4 +300,4 @@ def main() -> None:
 
 
 if __name__ == "__main__":
-    launch()
\ No newline at end of file
+    launch()
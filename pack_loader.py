@@ -0,0 +1,83 @@
+'''
+Loads pack files from vanilla packs zipball straight into memory. Members are
+inflated on a thread pool (zlib releases the GIL), so no files are written to
+disk. Use wiki_tools.mount_memory_files to make loaded files readable by
+generators.
+
+Run this file to compare it with extracting the zipball to disk:
+    python pack_loader.py <zipball path>
+'''
+from concurrent.futures import ThreadPoolExecutor
+from threading import local
+from zipfile import ZipFile
+from os import path, cpu_count
+
+# Pack folder: paths (files or folders ending with /) in it read by generators
+PACK_FILES = {
+    'behavior_pack': ('entities/', 'items/', 'spawn_rules/'),
+    'resource_pack': ('manifest.json', 'blocks.json', 'biomes_client.json', 'sounds/sound_definitions.json', 'texts/'),
+}
+PACK_FILE_EXTENSIONS = ('.json', '.lang')
+BATCH_SIZE = 64  # Members inflated by one task
+
+
+def select_members(zip_file: ZipFile, pack_files: dict = PACK_FILES) -> list:
+    """Returns members of zipball (which has one root folder) matching pack_files. Textures, models and other files not read by generators are skipped."""
+    members = []
+    for member in zip_file.infolist():
+        name_parts = member.filename.split('/')
+        if member.is_dir() or len(name_parts) < 3 or name_parts[1] not in pack_files:
+            continue
+        pack_path = '/'.join(name_parts[2:])
+        if pack_path.startswith(pack_files[name_parts[1]]) and pack_path.endswith(PACK_FILE_EXTENSIONS):
+            members.append(member)
+    return members
+
+def load_pack_members(zip_path: str, target_path: str, pack_files: dict = PACK_FILES, workers: int = 0) -> dict:
+    """Inflates members of zipball matching pack_files (see select_members) into memory. Returns map of file path (as if the packs were extracted into target_path) to its content."""
+    with ZipFile(zip_path) as zip_file:
+        members = select_members(zip_file, pack_files)
+    batches = [members[start:start+BATCH_SIZE] for start in range(0, len(members), BATCH_SIZE)]
+    thread_data = local()
+
+    def inflate(batch: list) -> list:
+        # ZipFile objects are not shared between threads, every thread reads through its own
+        if not hasattr(thread_data, 'zip_file'):
+            thread_data.zip_file = ZipFile(zip_path)
+            opened_zip_files.append(thread_data.zip_file)
+        return [(member.filename, thread_data.zip_file.read(member)) for member in batch]
+
+    opened_zip_files = []
+    files = {}
+    try:
+        with ThreadPoolExecutor(workers or min(32, (cpu_count() or 1) + 4)) as executor:
+            for inflated_batch in executor.map(inflate, batches):
+                for member_name, member_data in inflated_batch:
+                    files[path.join(target_path, *member_name.split('/')[1:])] = member_data
+    finally:
+        for zip_file in opened_zip_files:
+            zip_file.close()
+    return files
+
+
+if __name__ == '__main__':
+    from tempfile import TemporaryDirectory
+    from time import perf_counter
+    import sys
+
+    zip_path = sys.argv[1]
+    # Both ways load the same members
+    with TemporaryDirectory() as temp_folder:
+        start_time = perf_counter()
+        with ZipFile(zip_path) as zip_file:
+            members = select_members(zip_file)
+            zip_file.extractall(temp_folder, members)
+        extracted_size = 0
+        for member in members:
+            with open(path.join(temp_folder, *member.filename.split('/')), 'rb') as extracted_file:
+                extracted_size += len(extracted_file.read())
+        print(f'extractall + open: {perf_counter() - start_time:.2f} s ({len(members)} files, {extracted_size} bytes)')
+    for workers in [1, 0]:
+        start_time = perf_counter()
+        files = load_pack_members(zip_path, 'packs', workers=workers)
+        print(f'load_pack_members (workers={workers or "default"}): {perf_counter() - start_time:.2f} s ({len(files)} files, {sum(map(len, files.values()))} bytes)')
@@ -0,0 +1,82 @@
+'''
+Adds ResourcePackIndex class - shared index of resource pack files. Every file
+is loaded at most once and views built from it (block sounds, block list,
+biome fogs etc.) are computed once too. Index can be shared between threads.
+'''
+from os import path
+from threading import RLock
+import json_backend
+import jsonc_decoder
+import wiki_tools
+from lang_index import LangIndex
+
+
+class ResourcePackIndex:
+    '''
+    Lazy index of resource pack files. Use properties to get precomputed views
+    of the pack and load() for raw data of any JSON file.
+    '''
+    def __init__(self, rp_path: str):
+        self.rp_path = rp_path
+        self.lang = LangIndex(path.join(rp_path, 'texts'))
+        self._lock = RLock()
+        self._files = {}
+        self._views = {}
+
+    def load(self, relative_path: str, jsonc: bool = False):
+        """Returns parsed data of JSON file from resource pack. Set jsonc to True for files with comments."""
+        with self._lock:
+            if relative_path not in self._files:
+                file_data = wiki_tools.read_file(path.join(self.rp_path, relative_path))
+                if jsonc:
+                    self._files[relative_path] = jsonc_decoder.JSONCDecoder().decode(file_data.decode('UTF-8'))
+                else:
+                    self._files[relative_path] = json_backend.loads(file_data)
+            return self._files[relative_path]
+
+    def invalidate(self, relative_path: str) -> None:
+        """Forgets loaded data of changed file, so it is loaded again on next access."""
+        with self._lock:
+            if path.dirname(relative_path) == 'texts' and relative_path.endswith('.lang'):
+                self.lang.invalidate(path.basename(relative_path)[:-len('.lang')])
+            self._files.pop(relative_path, None)
+            self._views.clear()
+
+    def _view(self, name: str, build):
+        with self._lock:
+            if name not in self._views:
+                self._views[name] = build()
+            return self._views[name]
+
+    @property
+    def engine_version(self) -> list:
+        """`min_engine_version` from manifest.json."""
+        return self._view('engine_version', lambda: self.load('manifest.json')['header']['min_engine_version'])
+
+    @property
+    def block_sounds(self) -> dict:
+        """Block to 'sound' map from blocks.json. Blocks without sound are skipped."""
+        return self._view('block_sounds', lambda: {
+            block: block_data['sound'] for block, block_data in self.load('blocks.json').items()
+            if isinstance(block_data, dict) and 'sound' in block_data
+        })
+
+    @property
+    def blocks(self) -> list:
+        """List of blocks from blocks.json without `format_version`."""
+        return self._view('blocks', lambda: [
+            block for block in self.load('blocks.json') if block != 'format_version'
+        ])
+
+    @property
+    def biome_fogs(self) -> dict:
+        """Biome to fog identifier map from biomes_client.json."""
+        return self._view('biome_fogs', lambda: {
+            biome_name: biome_data['fog_identifier']
+            for biome_name, biome_data in self.load('biomes_client.json', jsonc=True)['biomes'].items()
+        })
+
+    @property
+    def sound_definitions(self) -> dict:
+        """`sound_definitions` from sounds/sound_definitions.json."""
+        return self._view('sound_definitions', lambda: self.load(path.join('sounds', 'sound_definitions.json'))['sound_definitions'])
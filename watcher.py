@@ -0,0 +1,30 @@
+'''
+Polling file watcher used by watch mode of main.py.
+'''
+from os import path, walk, stat
+
+
+def snapshot(*watched_paths: str) -> dict:
+    """Returns map of every file in given folders (or given files) to its modification time and size."""
+    files = {}
+    for watched_path in watched_paths:
+        if path.isfile(watched_path):
+            file_stat = stat(watched_path)
+            files[watched_path] = (file_stat.st_mtime_ns, file_stat.st_size)
+            continue
+        for folder, _, filenames in walk(watched_path):
+            for filename in filenames:
+                file_path = path.join(folder, filename)
+                try:
+                    file_stat = stat(file_path)
+                except FileNotFoundError:
+                    continue  # Removed while walking
+                files[file_path] = (file_stat.st_mtime_ns, file_stat.st_size)
+    return files
+
+def changed_paths(old_snapshot: dict, new_snapshot: dict) -> set:
+    """Returns paths of added, removed and modified files between two snapshots."""
+    return {
+        file_path for file_path in old_snapshot.keys() | new_snapshot.keys()
+        if old_snapshot.get(file_path) != new_snapshot.get(file_path)
+    }
@@ -1,3 +1,74 @@
+from os import path, getpid, chmod, stat, replace, remove, listdir
+from threading import get_ident, Lock
+from itertools import groupby
+import hashlib
+import re
+import json_backend
+import jsonc_decoder
+
+DRY_RUN = False  # If set, write_page only reports which pages would change
+PARSED_FILES = {}  # (file path, projection): (modification time, size, parsed data)
+PARSING_LOCKS = {}  # (file path, projection): lock, so the file is not parsed by two threads at once
+MEMORY_FILES = {}  # File path: content, see mount_memory_files
+MEMORY_FOLDERS = {}  # Folder path: sorted list of file and folder names in it
+PRINT_LOCK = Lock()  # Pages are written from many threads, see log
+SHARD_BOUNDARIES = re.compile(r'<!-- shard_boundaries: (.*) -->')  # Stored in index page of sharded page, see write_sharded_page
+SHARD_LINK = re.compile(r'^- \[[^\]]*\]\(/[^/)]+/([^/)]+)\)$', re.MULTILINE)  # Link to shard in index page
+SHARD_MERGE_RATIO = 0.5  # Neighbour shards are merged only when together they take at most this part of the limit
+
+
+def log(message: str) -> None:
+    """Prints message as a whole line, so lines printed by parallel page generators are not mixed."""
+    with PRINT_LOCK:
+        print(message, flush=True)
+
+def mount_memory_files(files: dict) -> None:
+    """Makes files (path: content) readable through read_file and list_dir as if they were on disk."""
+    MEMORY_FILES.clear()
+    MEMORY_FOLDERS.clear()
+    folders = {}
+    for file_path, file_content in files.items():
+        file_path = path.normpath(file_path)
+        MEMORY_FILES[file_path] = file_content
+        child_path = file_path
+        while path.dirname(child_path):
+            folder_path = path.dirname(child_path)
+            folders.setdefault(folder_path, set()).add(path.basename(child_path))
+            child_path = folder_path
+    for folder_path, names in folders.items():
+        MEMORY_FOLDERS[folder_path] = sorted(names)
+
+def read_file(file_path: str) -> bytes:
+    """Returns content of file from memory (see mount_memory_files) or disk."""
+    file_path = path.normpath(file_path)
+    if file_path in MEMORY_FILES:
+        return MEMORY_FILES[file_path]
+    with open(file_path, 'rb') as file:
+        return file.read()
+
+def list_dir(folder_path: str) -> list:
+    """Returns names in folder from memory (see mount_memory_files) or disk."""
+    folder_path = path.normpath(folder_path)
+    if folder_path in MEMORY_FOLDERS:
+        return list(MEMORY_FOLDERS[folder_path])
+    return listdir(folder_path)
+
+
+def load_jsonc_file(file_path: str, projection: tuple = None):
+    """Loads JSON file (comments are allowed). If projection (tuple of key paths) is given, only these keys are parsed, see jsonc_decoder.JSONCDecoder. Parsed data is cached until the file changes, so it must not be modified."""
+    if path.normpath(file_path) in MEMORY_FILES:
+        file_version = (0, len(MEMORY_FILES[path.normpath(file_path)]))
+    else:
+        file_stat = stat(file_path)
+        file_version = (file_stat.st_mtime_ns, file_stat.st_size)
+    with PARSING_LOCKS.setdefault((file_path, projection), Lock()):
+        cached_file = PARSED_FILES.get((file_path, projection))
+        if cached_file is not None and cached_file[:2] == file_version:
+            return cached_file[2]
+        file_data = jsonc_decoder.JSONCDecoder(projection=projection).decode(read_file(file_path).decode('UTF-8'))
+        PARSED_FILES[(file_path, projection)] = file_version + (file_data,)
+    return file_data
+
 def upload_content(page_path: str, *args) -> None:
     """Uploads content to page. Takes page path and content list(s)."""
 
@@ -18,11 +89,11 @@ def upload_content(page_path: str, *args) -> None:
             dumper_end_counter += 1
 
     if dumper_start_counter != dumper_end_counter:
-        print(f'Error! {page_path} is missing one or more start/end flag!')
+        log(f'Error! {page_path} is missing one or more start/end flag!')
         return
     dumper_flag_counter = dumper_start_counter
     if dumper_flag_counter != len(dumping_content):
-        print(f'Error! {page_path}: Flag pairs and content amount does not match!')
+        log(f'Error! {page_path}: Flag pairs and content amount does not match!')
         return
 
     start_flag_index = 0
@@ -72,11 +143,223 @@ def upload_content(page_path: str, *args) -> None:
         updating_wiki_page = updating_wiki_page[:start_flag_positions[-1]+1] + content + updating_wiki_page[start_flag_positions[-1]+1:]
         start_flag_positions.pop(-1)
 
-    with open(page_path, 'w', encoding='UTF-8') as wiki_page:
-        for line in updating_wiki_page:
-            wiki_page.write(line)
+    write_page(page_path, ''.join(updating_wiki_page))
+
+def write_page(page_path: str, content: str) -> bool:
+    """Writes content to page only if it differs from the existing file. The file is replaced atomically (temp file + rename). If DRY_RUN is set, only reports the change. Returns True if page is (or would be) changed."""
+    page_name = path.basename(page_path)
+    new_data = content.encode('UTF-8')
+    old_data = b''
+    if path.exists(page_path):
+        with open(page_path, 'rb') as wiki_page:
+            old_data = wiki_page.read()
+        if hashlib.sha256(old_data).digest() == hashlib.sha256(new_data).digest():
+            log(f'{page_name} - unchanged.')
+            return False
+    size_change = f'{len(new_data) - len(old_data):+} bytes'
+    if DRY_RUN:
+        log(f'{page_name} - would be updated ({size_change}).')
+        return True
+    temp_path = f'{page_path}.{getpid()}.{get_ident()}.tmp'
+    try:
+        with open(temp_path, 'wb') as temp_page:
+            temp_page.write(new_data)
+        if old_data:
+            chmod(temp_path, stat(page_path).st_mode)
+        replace(temp_path, page_path)
+    finally:
+        if path.exists(temp_path):
+            remove(temp_path)
+    log(f'{page_name} - updated! ({size_change})')
+    return True
+
+def front_matter(title: str, description: str, hidden: bool = False) -> str:
+    """Generates front matter of generated wiki page."""
+    page_front_matter = '---\n'
+    page_front_matter += f'title: {title}\n'
+    page_front_matter += 'category: Documentation\n'
+    page_front_matter += 'mentions:\n'
+    page_front_matter += '    - MedicalJewel105\n'
+    page_front_matter += f'description: {description}\n'
+    if hidden: page_front_matter += 'hidden: true\n'
+    page_front_matter += '---\n\n'
+    return page_front_matter
+
+def section_key(section_name: str) -> str:
+    """Returns key by which sections are sorted into shards: lowercase name without `minecraft:` namespace."""
+    return section_name.replace('minecraft:', '').lower()
 
-    print(page_path[page_path.rfind('/')+1:]+' - updated!')
+def distinct_prefix(name: str, other_name: str) -> str:
+    """Returns shortest prefix of name which is not a prefix of other_name (or whole name if there is none)."""
+    prefix_length = 1
+    while prefix_length < len(name) and name[:prefix_length] == other_name[:prefix_length]:
+        prefix_length += 1
+    return name[:prefix_length]
+
+def shard_sections(sections: dict, max_shard_size: int, boundaries: list = ()) -> list:
+    """Splits sections (name: content) into alphabetical ranges of section keys (see section_key). Range starts at its boundary (key prefix) and ends before boundary of next range. Boundaries from previous run are kept, so pages don't move between shards: only range bigger than max_shard_size is split (between any two sections with different keys, so one letter can be split too; section bigger than max_shard_size gets its own range) and only neighbour ranges which together take at most SHARD_MERGE_RATIO of max_shard_size are merged. Returns list of (boundary, section_names)."""
+    shards = [[boundary, [], 0] for boundary in sorted(set(boundaries) | {''})]
+    shard_index = 0
+    for section_name in sorted(sections, key=lambda section_name: (section_key(section_name), section_name)):
+        while shard_index+1 < len(shards) and section_key(section_name) >= shards[shard_index+1][0]:
+            shard_index += 1
+        shards[shard_index][1].append(section_name)
+
+    # Split ranges which are too big
+    split_shards = []
+    for boundary, section_names, _ in shards:
+        split_shards.append([boundary, [], 0])
+        # Sections with the same key can't be told apart by boundary, so they are never split
+        for key, same_key_names in groupby(section_names, key=section_key):
+            same_key_names = list(same_key_names)
+            same_key_size = sum(len(sections[section_name].encode('UTF-8')) for section_name in same_key_names)
+            if split_shards[-1][1] and split_shards[-1][2] + same_key_size > max_shard_size:
+                split_shards.append([distinct_prefix(key, section_key(split_shards[-1][1][-1])), [], 0])
+            split_shards[-1][1] += same_key_names
+            split_shards[-1][2] += same_key_size
+
+    # Merge empty and small ranges
+    merged_shards = []
+    for shard in split_shards:
+        if not shard[1]:
+            continue
+        if merged_shards and merged_shards[-1][2] + shard[2] <= max_shard_size * SHARD_MERGE_RATIO:
+            merged_shards[-1][1] += shard[1]
+            merged_shards[-1][2] += shard[2]
+        else:
+            merged_shards.append(shard)
+    if merged_shards:
+        merged_shards[0][0] = ''
+    return [(boundary, section_names) for boundary, section_names, _ in merged_shards]
+
+def shard_labels(shards: list) -> list:
+    """Returns labels of shards (see shard_sections) made of inclusive first and last section key prefixes, e.g. "a-f" or "behavior-a-behavior-m". Prefixes are as short as possible while they tell the section apart from sections of neighbour shards."""
+    labels = []
+    for shard_index, (_, section_names) in enumerate(shards):
+        previous_key = section_key(shards[shard_index-1][1][-1]) if shard_index > 0 else ''
+        next_key = section_key(shards[shard_index+1][1][0]) if shard_index+1 < len(shards) else ''
+        # Prefix must tell the section apart from both neighbour shards
+        first_prefix, last_prefix = (
+            max(distinct_prefix(key, previous_key), distinct_prefix(key, next_key), key=len)
+            for key in (section_key(section_names[0]), section_key(section_names[-1]))
+        )
+        label = first_prefix if first_prefix == last_prefix else f'{first_prefix}-{last_prefix}'
+        # Page slugs are kebab-case
+        labels.append(re.sub(r'[^a-z0-9]+', '-', label).strip('-'))
+    return labels
+
+def write_sharded_page(page_path: str, title: str, description: str, hidden: bool, intro: str, sections: dict, max_page_size: int = -1) -> None:
+    """Writes page from front matter, intro and sections. If page is bigger than max_page_size (in bytes), sections are split into alphabetically ranged shard pages (e.g. vuc-full-a-f.md) and page becomes an index linking them. Range boundaries are stored in the index page and reused by next run, see shard_sections. Use -1 to bypass."""
+    page_stem = page_path[:-len('.md')]
+    previous_boundaries = []
+    previous_shard_paths = []
+    if path.isfile(page_path):
+        with open(page_path, encoding='UTF-8') as previous_page:
+            previous_page_content = previous_page.read()
+        boundaries_match = SHARD_BOUNDARIES.search(previous_page_content)
+        if boundaries_match:
+            previous_boundaries = boundaries_match.group(1).split('|')
+        previous_shard_paths = [
+            path.join(path.dirname(page_path), shard_slug + '.md') for shard_slug in SHARD_LINK.findall(previous_page_content)
+            if shard_slug.startswith(path.basename(page_stem) + '-')
+        ]
+    page = front_matter(title, description, hidden) + intro + ''.join(sections.values())
+    shard_paths = []
+    if max_page_size != -1 and len(page.encode('UTF-8')) > max_page_size:
+        # Room for the longest expected range in shard title
+        header_size = len((front_matter(f'{title} ({"_"*64})', description, True) + intro).encode('UTF-8'))
+        shards = shard_sections(sections, max_page_size - header_size, previous_boundaries)
+        page = front_matter(title, description, hidden) + intro
+        page += '<!-- shard_boundaries: ' + '|'.join(boundary for boundary, _ in shards[1:]) + ' -->\n'
+        for (_, section_names), label in zip(shards, shard_labels(shards)):
+            shard_path = f'{page_stem}-{label}.md'
+            shard_title = f'{title} ({label.upper()})'
+            write_page(shard_path, front_matter(shard_title, description, True) + intro + ''.join(sections[name] for name in section_names))
+            shard_paths.append(shard_path)
+            shard_link = f'/{path.basename(path.dirname(page_path))}/{path.basename(shard_path)[:-len(".md")]}'
+            page += f'- [{label.upper()}]({shard_link})\n'
+    write_page(page_path, page)
+    # Remove shards of previous run which are not used anymore
+    for old_shard_path in previous_shard_paths:
+        if old_shard_path not in shard_paths and path.isfile(old_shard_path):
+            if DRY_RUN:
+                log(f'{path.basename(old_shard_path)} - would be removed.')
+            else:
+                remove(old_shard_path)
+                log(f'{path.basename(old_shard_path)} - removed!')
+
+def shape_signature(data, depth: int = 3) -> str:
+    """Returns cheap signature of data structure: object keys and value types up to given depth. Arrays are represented by their first element."""
+    if isinstance(data, dict):
+        if depth == 0:
+            return '{}'
+        return '{' + ','.join(f'{key}:{shape_signature(data[key], depth-1)}' for key in sorted(data)) + '}'
+    if isinstance(data, list):
+        if depth == 0 or not data:
+            return '[]'
+        return '[' + shape_signature(data[0], depth-1) + ']'
+    if isinstance(data, bool):
+        return 'b'
+    if isinstance(data, (int, float)):
+        return 'n'
+    if isinstance(data, str):
+        return 's'
+    return '0'
+
+def shape_paths(data, depth: int = 3, prefix: str = '') -> set:
+    """Returns set of key paths with value types (e.g. "filters/test:s") in data structure up to given depth. Used to rank shapes by keys they show."""
+    if isinstance(data, dict) and depth > 0:
+        paths = set()
+        for key, value in data.items():
+            paths.add(f'{prefix}{key}')
+            paths |= shape_paths(value, depth-1, f'{prefix}{key}/')
+        return paths
+    if isinstance(data, list) and data and depth > 0:
+        return shape_paths(data[0], depth-1, f'{prefix}[]/')
+    return {f'{prefix[:-1]}:{shape_signature(data, 0)}'} if prefix else set()
+
+def select_examples(examples: list, component_name: str, byte_budget: int, example_amount: int = -1, entity_example_amount: int = -1) -> list:
+    """Selects examples of component which fit into byte budget. Shapes (see shape_signature) are ranked by distinctness: every key path (see shape_paths) scores 1 / number of shapes having it, so shapes with rare or unique paths go first; ties are broken by rarer shape and smaller example. Ranking is one pass over the paths and one sort. The smallest example of every shape is taken in this order, then remaining budget is filled round-robin with next smallest examples of each shape. Not more than example_amount examples and entity_example_amount examples with the same "entity" are selected (-1 for no limit). At least one example is always selected. Keeps order of examples."""
+    shapes = {}  # Signature: indexes of examples
+    example_sizes = []
+    for example_index, example in enumerate(examples):
+        example_sizes.append(len(json_backend.dumps(example[component_name], indent=4).encode('UTF-8')))
+        shapes.setdefault(shape_signature(example[component_name]), []).append(example_index)
+    for shape_examples in shapes.values():
+        shape_examples.sort(key=lambda example_index: (example_sizes[example_index], example_index))
+
+    # Rank shapes by rarity of their key paths
+    paths_per_shape = {signature: shape_paths(examples[shape_examples[0]][component_name]) for signature, shape_examples in shapes.items()}
+    path_frequencies = {}
+    for paths in paths_per_shape.values():
+        for key_path in paths:
+            path_frequencies[key_path] = path_frequencies.get(key_path, 0) + 1
+    ranked_shapes = [shapes[signature] for signature in sorted(shapes, key=lambda signature: (
+        -sum(1 / path_frequencies[key_path] for key_path in paths_per_shape[signature]), len(shapes[signature]),
+        example_sizes[shapes[signature][0]], shapes[signature][0]
+    ))]
+
+    selected_indexes = []
+    entity_amounts = {}
+    used_budget = 0
+    round_index = 0
+    while ranked_shapes and len(selected_indexes) != example_amount:
+        # Only shapes which still have examples take part in next round
+        ranked_shapes = [shape_examples for shape_examples in ranked_shapes if round_index < len(shape_examples)]
+        for shape_examples in ranked_shapes:
+            if len(selected_indexes) == example_amount:
+                break
+            example_index = shape_examples[round_index]
+            entity = examples[example_index].get('entity')
+            if used_budget + example_sizes[example_index] > byte_budget or entity_amounts.get(entity, 0) == entity_example_amount:
+                continue
+            selected_indexes.append(example_index)
+            entity_amounts[entity] = entity_amounts.get(entity, 0) + 1
+            used_budget += example_sizes[example_index]
+        round_index += 1
+    if not selected_indexes and examples:
+        selected_indexes.append(min(range(len(examples)), key=lambda example_index: example_sizes[example_index]))
+    return [examples[example_index] for example_index in sorted(selected_indexes)]
 
 def table(sort_column_index: int, *args: list) -> list:
     """Creates a table from given lists (one list - one column). If you don't want your table to be sorted, set sort_column_index to -1."""